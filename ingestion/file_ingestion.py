@@ -1,288 +1,651 @@
-import pandas as pd
-import numpy as np
-from zipfile import ZipFile
-import gzip
-import os
-import re
-from math import ceil
-import openpyxl
-from zipfile import ZipFile
-import gzip
-from gzip import GzipFile
-from collections import Counter
-import json
-import ast
-from itertools import combinations
-import io
-import warnings
-
-
-def getFileManager(obj, sourceobj=None, file_encoding=None):
-    if (isinstance(obj, str) and ".zip" in obj) or isinstance(obj, ZipFile):
-        return ZipManager(obj, sourceobj, file_encoding)
-    elif (
-        isinstance(obj, str) or isinstance(obj, io.IOBase) or isinstance(obj, GzipFile)
-    ):
-        return BaseFileManager(obj, sourceobj, file_encoding)
-    elif isinstance(obj, list):
-        return {
-            subobj: getFileManager(
-                subobj,
-                sourceobj,
-                file_encoding) for subobj in obj}
-    else:
-        raise NotImplementedError(
-            "Unsupported feature passed as obj in getFileManager: {}".format(obj))
-
-
-class FilesHelper:
-    def __init__(self, target, **kwargs):
-        """Initialize and set target non-case-sensitive file stem or keywords, usually in form 'MyFundD' or 'MyFundD_Data'"""
-        self.target = target
-
-    @staticmethod
-    def strip(item):
-        return re.sub(r"[ \-,_]", "", item).lower()
-
-    def list_categories(self, level=3):
-        """List categories of found files grouped by keyword: level"""
-        self.target_categories = sorted(
-            list(set(["_".join(file.split("_")[:level]) for file in self.list_files()]))
-        )
-        return self.target_categories
-
-
-class BaseFileManager:
-    def __init__(self, obj, sourceobj=None, file_encoding=None):
-        self.sourceobj = sourceobj
-        self.file_encoding = file_encoding
-        if isinstance(obj, str):
-            self.filename = obj.split("/")[-1]
-        elif isinstance(obj, io.IOBase):
-            self.filename = obj.name.split("/")[-1]
-        elif isinstance(obj, GzipFile):
-            self.filename = obj.filename
-        else:
-            raise NotImplementedError(
-                "Unsupported feature passed to obj in FileManager: {}".format(obj))
-        self.filetype = (
-            components[-1]
-            if len(components := self.filename.split(".")) == 2
-            else ".".join(components[-2:])
-        )
-        self.fileobj = obj
-
-    def open(self, mode="r"):
-        """Attempt to open a file of many types, will attempt to import the artifact once if not found but will error if unsuccessful."""
-        if self.sourceobj:
-            if isinstance(self.sourceobj, str):
-                self.sourceobj = ZipFile(self.sourceobj, mode)
-            elif isinstance(self.sourceobj, ZipFile) and not self.sourceobj.fp:
-                self.sourceobj = ZipFile(self.sourceobj.filename, mode)
-            self.fileobj = self.sourceobj.open(self.filename, mode)
-        elif isinstance(self.fileobj, str):
-            if "xlsx" in self.filetype:
-                _ = open(self.fileobj)
-                _.close()
-            else:
-                if "gz" in self.filetype:
-                    self.fileobj = gzip.open(
-                        self.fileobj, "rt", encoding=self.file_encoding
-                    )
-                else:
-                    self.fileobj = open(
-                        self.fileobj, mode, encoding=self.file_encoding)
-        elif isinstance(self.fileobj, io.IOBase):
-            self.fileobj = open(
-                self.filename, mode, encoding=self.file_encoding)
-        else:
-            raise NotImplementedError(
-                f"Opening unknown filetype: {self.fileobj}")
-
-    def infer_delimiter(self):
-        try:
-            sample1, sample2 = self.fileobj.readline(), self.fileobj.readline()
-            self.fileobj.seek(0, 0)
-            sample1, sample2 = (
-                sample1.decode() if isinstance(sample1, bytes) else sample1,
-                sample2.decode() if isinstance(sample2, bytes) else sample2,
-            )
-            # TODO: Not multi-len delimiter safe. Example: matching ~| and
-            # double matching \t for null cells ... (\t\t) -> (\t, \t) not easy
-
-            def _delims(x):
-                return re.findall("[\\t|,~;]", x)
-
-            delims1, delims2 = map(_delims, (sample1, sample2))
-            occurences1, occurences2 = map(
-                lambda x: Counter(x).most_common(), (delims1, delims2)
-            )
-            print("Delims found: ", occurences1, occurences2)
-            delimiter = sorted(
-                list(set(occurences1).intersection(set(occurences2))),
-                key=lambda x: x[1],
-                reverse=True,
-            ).pop()[0]
-            return (delimiter, sample1, sample2, occurences1, occurences2)
-        except Exception as e:
-            self.fileobj.close()
-            raise e
-
-    def read_file_to_df(
-        self,
-        delimiter="infer",
-        header="infer",
-        names=None,
-        engine=None,
-        json_key=None,
-        add_filename=True,
-    ):
-        try:
-            self.open()
-            if "csv" in self.filetype:
-                df = pd.read_csv(
-                    self.fileobj,
-                    header=header,
-                    engine=engine,
-                    names=names,
-                    encoding=self.file_encoding,
-                )
-            elif "tsv" in self.filetype:
-                df = pd.read_csv(
-                    self.fileobj,
-                    delimiter="\t",
-                    header=header,
-                    engine=engine,
-                    names=names,
-                    encoding=self.file_encoding,
-                )
-            elif "xlsx" in self.filetype:
-                df = pd.read_excel(
-                    self.fileobj, header=header, engine="openpyxl")
-            elif "xls" in self.filetype:
-                df = pd.read_excel(self.fileobj.read())
-            elif "txt" in self.filetype:
-                if delimiter == "infer":
-                    delimiter_pack = self.infer_delimiter()
-                    self.inferred_delimiter_pack = delimiter_pack
-                    inferred_delimiter = delimiter_pack[0]
-                    df = pd.read_csv(
-                        self.fileobj,
-                        delimiter=inferred_delimiter,
-                        header=header,
-                        engine=engine,
-                        names=names,
-                        encoding=self.file_encoding,
-                    )
-                else:
-                    df = pd.read_csv(
-                        self.fileobj,
-                        delimiter=delimiter,
-                        header=header,
-                        engine=engine,
-                        names=names,
-                        encoding=self.file_encoding,
-                    )
-            elif "json" in self.filetype:
-                data = json.load(self.fileobj)
-                if json_key:
-                    json_to_df = data[json_key]
-                    df = pd.DataFrame(json_to_df)
-                else:
-                    df = pd.read_json(data)
-            else:
-                raise NotImplementedError("File is in an incompatible format")
-            if add_filename:
-                df["source_filename"] = self.filename
-            print("Imported ", df.shape, " records from ", self.filename)
-            self.df = df
-            return df
-        except Exception as e:
-            print("Error while attempting to read the file", self.filename)
-            raise e
-        finally:
-            if not isinstance(self.fileobj, str):
-                self.fileobj.close()
-
-
-class FilesManager:
-    def __init__(self, filenames, sourceobj=None, file_encoding=None):
-        self.filenames = filenames
-        self.sourceobj = sourceobj
-        self.filemanagers = {
-            filename: getFileManager(
-                filename, self.src_asset_id, self.sourceobj, file_encoding
-            )
-            for filename in self.filenames
-        }
-
-
-class ZipManager(FilesManager):
-    def __init__(self, obj, sourceobj=None, file_encoding=None):
-        self.sourceobj = sourceobj
-        if isinstance(obj, str):
-            self.filename = obj
-            if not self.sourceobj:
-                self.fileobj = ZipFile(obj, "r")
-            else:
-                self.fileobj = ZipFile(self.sourceobj.open(obj, "r"), "r")
-            self.filenames = self.fileobj.namelist()
-        elif isinstance(obj, ZipFile):
-            self.filename = obj.filename
-            self.fileobj = obj
-            self.filenames = self.fileobj.namelist()
-        else:
-            raise NotImplementedError("Unknown archive format: ", obj)
-        super().__init__(self.filenames, self.fileobj, file_encoding)
-
-    def extract_all(
-        self,
-        filenames=None,
-        delimiter="infer",
-        header=0,
-        names=None,
-        engine=None,
-        json_key=None,
-        add_filename=True,
-    ):
-        temp = pd.DataFrame()
-        filenames = self.filemanagers.keys() if not filenames else filenames
-        for filename in filenames:
-            df = self.extract_one(
-                filename,
-                delimiter=delimiter,
-                header=header,
-                names=names,
-                engine=engine,
-                json_key=json_key,
-                add_filename=add_filename,
-            )
-            temp = pd.concat((temp, df))
-        self.fileobj.close()
-        return temp
-
-    def extract_one(
-        self,
-        filename=None,
-        delimiter="infer",
-        header=0,
-        names=None,
-        engine=None,
-        json_key=None,
-        add_filename=True,
-    ):
-        if not filename:
-            filename = self.fileobj.namelist()[0]
-        try:
-            filemanager = self.filemanagers[filename]
-        except KeyError:
-            raise AttributeError("File not found in self.filemanagers")
-        df = filemanager.read_file_to_df(
-            delimiter=delimiter,
-            header=header,
-            names=names,
-            engine=engine,
-            json_key=json_key,
-            add_filename=add_filename,
-        )
-        return df
+import pandas as pd
+import numpy as np
+from zipfile import ZipFile
+import gzip
+import os
+from math import ceil
+import openpyxl
+from zipfile import ZipFile
+import gzip
+from gzip import GzipFile
+try:
+    import orjson as json
+except ImportError:
+    import json
+import ast
+from itertools import combinations
+from concurrent.futures import ThreadPoolExecutor
+import io
+import importlib.util
+import logging
+import mmap
+import warnings
+
+_LOG = logging.getLogger(__name__)
+
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+_HAS_RAPIDGZIP = importlib.util.find_spec("rapidgzip") is not None
+_HAS_NUMBA = importlib.util.find_spec("numba") is not None
+if not _HAS_RAPIDGZIP and hasattr(gzip, "READ_BUFFER_SIZE"):
+    # Larger inflate reads for the stdlib fallback (CPython gh-95534)
+    gzip.READ_BUFFER_SIZE = 128 * 1024
+
+# double-barrelled suffixes that keep both parts as the filetype
+_COMPOUND_EXTS = frozenset(("tar.gz", "csv.gz", "tsv.gz", "txt.gz", "json.gz"))
+
+# deletion table for FilesHelper.strip: one C-level pass, no regex engine
+_STRIP_TBL = str.maketrans("", "", " -,_")
+
+# pandas' default NA sentinels, applied to the arrow path so bare string
+# tokens like "null"/"NA" null out the way the C engine treats them
+_NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None",
+    "n/a", "nan", "null",
+]
+
+# delimiter candidates for infer_delimiter, in tie-break priority order
+_DELIM_CANDIDATES = np.array(
+    [9, ord("|"), ord(","), ord("~"), ord(";")], dtype=np.intp)
+
+_NUMERIC_BYTES = np.zeros(256, dtype=bool)
+_NUMERIC_BYTES[np.frombuffer(b"0123456789+-.eE\r\n", dtype=np.uint8)] = True
+
+_fast_numeric_kernel = None
+
+
+def _get_fast_numeric_kernel():
+    """Compile (once, on first use) the njit tokenizer for numeric text."""
+    global _fast_numeric_kernel
+    if _fast_numeric_kernel is None:
+        from numba import njit, prange
+
+        @njit(parallel=True, cache=True)
+        def kernel(data, row_ends, delim, out, errs):
+            nrows, ncols = out.shape
+            for i in prange(nrows):
+                start = 0 if i == 0 else row_ends[i - 1] + 1
+                end = row_ends[i]
+                if end > start and data[end - 1] == 13:  # trailing \r
+                    end -= 1
+                col = 0
+                j = start
+                bad = False
+                while j < end and col < ncols:
+                    seen = False
+                    sign = 1.0
+                    if data[j] == 45:  # -
+                        sign = -1.0
+                        j += 1
+                    elif data[j] == 43:  # +
+                        j += 1
+                    # accumulate the mantissa exactly as an integer and
+                    # apply the decimal exponent once, instead of repeated
+                    # float multiply/adds that drift by many ulps
+                    mant = 0
+                    ndig = 0
+                    exp10 = 0
+                    while j < end and 48 <= data[j] <= 57:
+                        if ndig < 18:
+                            mant = mant * 10 + (data[j] - 48)
+                            ndig += 1
+                        else:
+                            exp10 += 1
+                        seen = True
+                        j += 1
+                    if j < end and data[j] == 46:  # .
+                        j += 1
+                        while j < end and 48 <= data[j] <= 57:
+                            if ndig < 18:
+                                mant = mant * 10 + (data[j] - 48)
+                                ndig += 1
+                                exp10 -= 1
+                            seen = True
+                            j += 1
+                    if j < end and (data[j] == 101 or data[j] == 69):  # e E
+                        j += 1
+                        esign = -1 if j < end and data[j] == 45 else 1
+                        if j < end and (data[j] == 45 or data[j] == 43):
+                            j += 1
+                        exponent = 0
+                        eseen = False
+                        while j < end and 48 <= data[j] <= 57:
+                            exponent = exponent * 10 + (data[j] - 48)
+                            eseen = True
+                            j += 1
+                        if not eseen:  # bare 'e'/'E' marker: not a number
+                            bad = True
+                            break
+                        exp10 += esign * exponent
+                    if not seen:  # empty or non-numeric token
+                        bad = True
+                        break
+                    # float exponent forces libm pow (correctly rounded)
+                    # rather than llvm powi (repeated multiplication); the
+                    # two-step scale keeps deep-negative exponents out of
+                    # the subnormal range until the mantissa is applied
+                    if exp10 < -308:
+                        value = mant * 1e-308 * 10.0 ** (float(exp10) + 308.0)
+                    else:
+                        value = mant * 10.0 ** float(exp10)
+                    out[i, col] = sign * value
+                    col += 1
+                    if j < end:
+                        if data[j] != delim:  # stray byte after a token
+                            bad = True
+                            break
+                        j += 1
+                # a clean row consumes every byte and fills every column
+                if bad or col != ncols or j != end:
+                    errs[i] = 1
+        _fast_numeric_kernel = kernel
+    return _fast_numeric_kernel
+
+
+def _fast_numeric_read(fileobj, delimiter, names=None):
+    """mmap + njit tokenize a numeric-only delimited file into a DataFrame.
+
+    Returns None when the payload does not look purely numeric (probed on
+    the first KiB), has ragged or blank rows, or any token fails to parse
+    cleanly in the kernel, leaving the caller to fall back to pd.read_csv.
+
+    The kernel accumulates mantissas as exact integers and scales once, so
+    results match strtod for typical payloads; values with more than 18
+    significant digits or extreme exponents may still differ from
+    pd.read_csv in the last ulp or two.
+    """
+    buf = mmap.mmap(fileobj.fileno(), 0, access=mmap.ACCESS_READ)
+    data = np.frombuffer(buf, dtype=np.uint8)
+    if data.size == 0:
+        return pd.DataFrame(columns=names)
+    delim_byte = ord(delimiter)
+    allowed = _NUMERIC_BYTES.copy()
+    allowed[delim_byte] = True
+    if not allowed[data[:1024]].all():
+        return None
+    row_ends = np.flatnonzero(data == 10)
+    if data[-1] != 10:
+        row_ends = np.append(row_ends, data.size)
+    if (np.diff(row_ends) == 1).any() or row_ends[0] == 0:
+        return None  # blank lines
+    delims_before = np.cumsum(data == delim_byte)[row_ends - 1]
+    per_row = np.diff(delims_before, prepend=0)
+    if not (per_row == per_row[0]).all():
+        return None  # ragged rows
+    out = np.empty((len(row_ends), int(per_row[0]) + 1), dtype=np.float64)
+    errs = np.zeros(len(row_ends), dtype=np.uint8)
+    _get_fast_numeric_kernel()(data, row_ends, delim_byte, out, errs)
+    if errs.any():
+        return None  # parse anomaly somewhere past the probe window
+    return pd.DataFrame(out, columns=names)
+
+
+# filename resolution by source type; exact-type lookup first, then an
+# isinstance scan in declaration order (GzipFile before its IOBase base)
+_FILENAME_RESOLVERS = {
+    str: os.path.basename,
+    GzipFile: lambda obj: os.path.basename(obj.name),
+    io.IOBase: lambda obj: os.path.basename(obj.name),
+}
+
+
+def getFileManager(obj, sourceobj=None, file_encoding=None):
+    if (isinstance(obj, str) and ".zip" in obj) or isinstance(obj, ZipFile):
+        return ZipManager(obj, sourceobj, file_encoding)
+    elif isinstance(obj, (str, io.IOBase, GzipFile)):
+        return BaseFileManager(obj, sourceobj, file_encoding)
+    elif isinstance(obj, list):
+        return {
+            subobj: getFileManager(
+                subobj,
+                sourceobj,
+                file_encoding) for subobj in obj}
+    else:
+        raise NotImplementedError(
+            "Unsupported feature passed as obj in getFileManager: {}".format(obj))
+
+
+class FilesHelper:
+    def __init__(self, target, **kwargs):
+        """Initialize and set target non-case-sensitive file stem or keywords, usually in form 'MyFundD' or 'MyFundD_Data'"""
+        self.target = target
+
+    @staticmethod
+    def strip(item):
+        return item.translate(_STRIP_TBL).lower()
+
+    def list_categories(self, level=3):
+        """List categories of found files grouped by keyword: level"""
+        self.target_categories = sorted(
+            list(set(["_".join(file.split("_")[:level]) for file in self.list_files()]))
+        )
+        return self.target_categories
+
+
+class BaseFileManager:
+    def __init__(self, obj, sourceobj=None, file_encoding=None):
+        self.sourceobj = sourceobj
+        self.file_encoding = file_encoding
+        resolver = _FILENAME_RESOLVERS.get(type(obj)) or next(
+            (fn for cls, fn in _FILENAME_RESOLVERS.items()
+             if isinstance(obj, cls)),
+            None,
+        )
+        if resolver is None:
+            raise NotImplementedError(
+                "Unsupported feature passed to obj in FileManager: {}".format(obj))
+        self.filename = resolver(obj)
+        head, _, tail = self.filename.rpartition(".")
+        _, _, mid = head.rpartition(".")
+        compound = f"{mid}.{tail}"
+        self.filetype = compound if compound in _COMPOUND_EXTS else tail
+        self.fileobj = obj
+
+    def open(self, mode="r"):
+        """Attempt to open a file of many types, will attempt to import the artifact once if not found but will error if unsuccessful."""
+        if self.sourceobj:
+            if isinstance(self.sourceobj, str):
+                self.sourceobj = ZipFile(self.sourceobj, mode)
+            elif isinstance(self.sourceobj, ZipFile) and not self.sourceobj.fp:
+                self.sourceobj = ZipFile(self.sourceobj.filename, mode)
+            # one linear copy into a seekable buffer: parsers then scan
+            # contiguous bytes instead of short reads through ZipExtFile
+            self.fileobj = io.BytesIO(self.sourceobj.read(self.filename))
+        elif isinstance(self.fileobj, str):
+            if "xlsx" in self.filetype:
+                # fail early without the open/close FD churn; openpyxl
+                # opens the path itself in read_file_to_df
+                if not os.path.isfile(self.fileobj):
+                    raise FileNotFoundError(self.fileobj)
+            else:
+                if "gz" in self.filetype:
+                    if _HAS_RAPIDGZIP:
+                        import rapidgzip
+
+                        self.fileobj = io.TextIOWrapper(
+                            rapidgzip.open(
+                                self.fileobj,
+                                parallelization=os.cpu_count() or 1,
+                            ),
+                            encoding=self.file_encoding,
+                        )
+                    else:
+                        self.fileobj = gzip.open(
+                            self.fileobj, "rt", encoding=self.file_encoding
+                        )
+                else:
+                    self.fileobj = open(
+                        self.fileobj, mode, encoding=self.file_encoding)
+        elif isinstance(self.fileobj, io.IOBase):
+            self.fileobj = open(
+                self.filename, mode, encoding=self.file_encoding)
+        else:
+            raise NotImplementedError(
+                f"Opening unknown filetype: {self.fileobj}")
+
+    def infer_delimiter(self):
+        try:
+            sample = self.fileobj.read(65536)
+            self.fileobj.seek(0, 0)
+            if not isinstance(sample, bytes):
+                sample = sample.encode(self.file_encoding or "utf-8")
+            # TODO: Not multi-len delimiter safe. Example: matching ~| and
+            # double matching \t for null cells ... (\t\t) -> (\t, \t) not easy
+            hist = np.bincount(
+                np.frombuffer(sample, dtype=np.uint8), minlength=256)
+            counts = hist[_DELIM_CANDIDATES]
+            if not counts.any():
+                raise ValueError(
+                    "No delimiter found in sample of {}".format(self.filename))
+            occurences = [
+                (chr(c), int(n))
+                for c, n in zip(_DELIM_CANDIDATES, counts) if n
+            ]
+            _LOG.debug("Delims found: %r", occurences)
+            # argmax ties resolve to the earliest candidate
+            delimiter = chr(_DELIM_CANDIDATES[counts.argmax()])
+            return (delimiter, sample, occurences)
+        except Exception as e:
+            self.fileobj.close()
+            raise e
+
+    def _read_csv(
+        self,
+        delimiter=None,
+        header="infer",
+        names=None,
+        engine=None,
+        dtype=None,
+        chunksize=None,
+        filter_fn=None,
+        use_pyarrow=False,
+    ):
+        """Read a delimited file with the fastest available parser.
+
+        use_pyarrow=True opts into pyarrow's multithreaded tokenizer (off by
+        default until its conversion semantics are fully validated against
+        the C engine), falling back to the pandas C engine (never the python
+        engine unless explicitly requested via engine=). With chunksize= the
+        file is streamed through
+        the C engine so peak memory stays O(chunk); filter_fn is applied per
+        chunk (or once on the whole frame otherwise) before concatenation.
+        """
+        kwargs = dict(
+            delimiter=delimiter,
+            header=header,
+            names=names,
+            dtype=dtype,
+            encoding=self.file_encoding,
+        )
+        if (
+            engine is None
+            and use_pyarrow
+            and _HAS_PYARROW
+            and not chunksize
+            and dtype is None
+            and header in (0, "infer")
+            and (self.file_encoding or "utf8").lower().replace("-", "")
+            == "utf8"
+        ):
+            try:
+                df = self._read_csv_arrow(delimiter, header, names)
+                return filter_fn(df) if filter_fn else df
+            except Exception:
+                if not self.fileobj.seekable():
+                    raise
+                self.fileobj.seek(0)
+        engine = engine or "c"
+        if engine == "c":
+            kwargs["low_memory"] = False
+            # only memory-map plain files: gzip-backed handles expose the
+            # compressed bytes through fileno(), and in-memory buffers
+            # (BytesIO zip members) have no usable fileno at all
+            if "gz" not in self.filetype:
+                try:
+                    self.fileobj.fileno()
+                except (AttributeError, OSError, ValueError):
+                    pass
+                else:
+                    kwargs["memory_map"] = True
+        if not chunksize:
+            df = pd.read_csv(self.fileobj, engine=engine, **kwargs)
+            return filter_fn(df) if filter_fn else df
+        chunks = []
+        with pd.read_csv(
+            self.fileobj, engine=engine, chunksize=chunksize, **kwargs
+        ) as reader:
+            for chunk in reader:
+                chunks.append(filter_fn(chunk) if filter_fn else chunk)
+        if not chunks:
+            return pd.DataFrame(columns=names)
+        return pd.concat(chunks, ignore_index=True)
+
+    def _read_csv_arrow(self, delimiter, header, names):
+        """Tokenize with pyarrow.csv: a multithreaded SIMD scan over 16 MiB
+        blocks, converted without an extra copy via split_blocks/self_destruct.
+
+        Mirrors the pandas header/names semantics for the cases the caller
+        gates on (header 0 or 'infer') and applies pandas' NA sentinels so
+        unquoted "null"/"NA" strings null out like the C engine. Arrow still
+        infers date/time-looking columns as native date/time objects where
+        the C engine keeps strings, which is why this path stays opt-in
+        (use_pyarrow=True) rather than the default.
+        """
+        import pyarrow.csv as pacsv
+
+        read_options = pacsv.ReadOptions(use_threads=True, block_size=16 << 20)
+        if names is not None:
+            read_options.column_names = names
+            if header == 0:
+                read_options.skip_rows = 1
+        table = pacsv.read_csv(
+            getattr(self.fileobj, "buffer", self.fileobj),
+            read_options=read_options,
+            parse_options=pacsv.ParseOptions(delimiter=delimiter or ","),
+            convert_options=pacsv.ConvertOptions(
+                strings_can_be_null=True,
+                null_values=_NA_VALUES,
+            ),
+        )
+        return table.to_pandas(split_blocks=True, self_destruct=True)
+
+    def read_file_to_df(
+        self,
+        delimiter="infer",
+        header="infer",
+        names=None,
+        engine=None,
+        dtype=None,
+        chunksize=None,
+        filter_fn=None,
+        use_pyarrow=False,
+        json_key=None,
+        add_filename=True,
+        try_fast_numeric=True,
+    ):
+        try:
+            self.open()
+            if "csv" in self.filetype:
+                df = self._read_csv(
+                    header=header,
+                    engine=engine,
+                    names=names,
+                    dtype=dtype,
+                    chunksize=chunksize,
+                    filter_fn=filter_fn,
+                    use_pyarrow=use_pyarrow,
+                )
+            elif "tsv" in self.filetype:
+                df = self._read_csv(
+                    delimiter="\t",
+                    header=header,
+                    engine=engine,
+                    names=names,
+                    dtype=dtype,
+                    chunksize=chunksize,
+                    filter_fn=filter_fn,
+                    use_pyarrow=use_pyarrow,
+                )
+            elif "xlsx" in self.filetype:
+                # read_only streams rows instead of materializing the whole
+                # workbook zip in memory
+                workbook = openpyxl.load_workbook(
+                    self.fileobj, read_only=True, data_only=True)
+                try:
+                    rows = workbook.active.values
+                    if header is None:
+                        df = pd.DataFrame(rows)
+                    else:
+                        for _ in range(0 if header == "infer" else header):
+                            next(rows, None)
+                        df = pd.DataFrame(rows, columns=next(rows, None))
+                finally:
+                    workbook.close()
+            elif "xls" in self.filetype:
+                df = pd.read_excel(self.fileobj)
+            elif "txt" in self.filetype:
+                if delimiter == "infer":
+                    delimiter_pack = self.infer_delimiter()
+                    self.inferred_delimiter_pack = delimiter_pack
+                    delimiter = delimiter_pack[0]
+                df = None
+                if (
+                    try_fast_numeric
+                    and _HAS_NUMBA
+                    and chunksize is None
+                    and header is None
+                    and hasattr(self.fileobj, "fileno")
+                ):
+                    try:
+                        df = _fast_numeric_read(
+                            self.fileobj, delimiter, names)
+                    except Exception:
+                        df = None
+                if df is None:
+                    df = self._read_csv(
+                        delimiter=delimiter,
+                        header=header,
+                        engine=engine,
+                        names=names,
+                        dtype=dtype,
+                        chunksize=chunksize,
+                        filter_fn=filter_fn,
+                        use_pyarrow=use_pyarrow,
+                    )
+            elif "json" in self.filetype:
+                data = json.loads(self.fileobj.read())
+                if json_key:
+                    data = data[json_key]
+                df = (
+                    pd.DataFrame.from_records(data)
+                    if isinstance(data, list)
+                    else pd.DataFrame(data)
+                )
+            else:
+                raise NotImplementedError("File is in an incompatible format")
+            if add_filename:
+                # one int8 code per row plus a single-entry dictionary,
+                # instead of N identical object pointers
+                df["source_filename"] = pd.Categorical.from_codes(
+                    np.zeros(len(df), dtype=np.int8),
+                    categories=[self.filename],
+                )
+            _LOG.info(
+                "Imported %s records from %s", df.shape, self.filename)
+            self.df = df
+            return df
+        except Exception as e:
+            _LOG.error(
+                "Error while attempting to read the file %s", self.filename)
+            raise e
+        finally:
+            if not isinstance(self.fileobj, str):
+                self.fileobj.close()
+
+
+class FilesManager:
+    def __init__(self, filenames, sourceobj=None, file_encoding=None):
+        self.filenames = filenames
+        self.sourceobj = sourceobj
+        self.file_encoding = file_encoding
+        managers = getFileManager(
+            self.filenames, self.sourceobj, file_encoding)
+        self.filemanagers = (
+            managers
+            if isinstance(managers, dict)
+            else {self.filenames: managers}
+        )
+
+
+class ZipManager(FilesManager):
+    def __init__(self, obj, sourceobj=None, file_encoding=None):
+        self.sourceobj = sourceobj
+        if isinstance(obj, str):
+            self.filename = obj
+            if not self.sourceobj:
+                self.fileobj = ZipFile(obj, "r")
+            else:
+                self.fileobj = ZipFile(self.sourceobj.open(obj, "r"), "r")
+            self.filenames = self.fileobj.namelist()
+        elif isinstance(obj, ZipFile):
+            self.filename = obj.filename
+            self.fileobj = obj
+            self.filenames = self.fileobj.namelist()
+        else:
+            raise NotImplementedError("Unknown archive format: ", obj)
+        super().__init__(self.filenames, self.fileobj, file_encoding)
+
+    def extract_all(
+        self,
+        filenames=None,
+        delimiter="infer",
+        header=0,
+        names=None,
+        engine=None,
+        dtype=None,
+        chunksize=None,
+        filter_fn=None,
+        use_pyarrow=False,
+        json_key=None,
+        add_filename=True,
+    ):
+        filenames = list(
+            self.filemanagers.keys() if not filenames else filenames)
+        read_kwargs = dict(
+            delimiter=delimiter,
+            header=header,
+            names=names,
+            engine=engine,
+            dtype=dtype,
+            chunksize=chunksize,
+            filter_fn=filter_fn,
+            use_pyarrow=use_pyarrow,
+            json_key=json_key,
+            add_filename=add_filename,
+        )
+        if len(filenames) > 1 and isinstance(
+                self.filename, str) and os.path.isfile(self.filename):
+            frames = self._extract_parallel(filenames, **read_kwargs)
+        else:
+            frames = [
+                self.extract_one(filename, **read_kwargs)
+                for filename in filenames
+            ]
+        self.fileobj.close()
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, ignore_index=True)
+
+    def _extract_parallel(self, filenames, **read_kwargs):
+        """Read zip members concurrently, one df per member.
+
+        ZipFile is not safe for concurrent member reads, so every worker
+        opens its own handle on the archive; the GIL is released inside the
+        pandas tokenizer and zlib inflate, letting workers overlap.
+        """
+        def _worker(filename):
+            archive = ZipFile(self.filename, "r")
+            try:
+                manager = getFileManager(
+                    filename, archive, self.file_encoding)
+                return manager.read_file_to_df(**read_kwargs)
+            finally:
+                archive.close()
+
+        workers = min(len(filenames), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_worker, filenames))
+
+    def extract_one(
+        self,
+        filename=None,
+        delimiter="infer",
+        header=0,
+        names=None,
+        engine=None,
+        dtype=None,
+        chunksize=None,
+        filter_fn=None,
+        use_pyarrow=False,
+        json_key=None,
+        add_filename=True,
+    ):
+        if not filename:
+            filename = self.filenames[0]
+        try:
+            filemanager = self.filemanagers[filename]
+        except KeyError:
+            raise AttributeError("File not found in self.filemanagers")
+        df = filemanager.read_file_to_df(
+            delimiter=delimiter,
+            header=header,
+            names=names,
+            engine=engine,
+            dtype=dtype,
+            chunksize=chunksize,
+            filter_fn=filter_fn,
+            use_pyarrow=use_pyarrow,
+            json_key=json_key,
+            add_filename=add_filename,
+        )
+        return df